@@ -2,53 +2,147 @@
 """Web UI demo for testing MCP tools."""
 
 import asyncio
+import fcntl
+import hashlib
 import json
 import os
+import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from typing import Any, Dict, List
 
 try:
     from fastapi import FastAPI, Request, HTTPException
-    from fastapi.responses import HTMLResponse
+    from fastapi.middleware.gzip import GZipMiddleware
+    from fastapi.responses import Response
+    from fastapi.staticfiles import StaticFiles
     import uvicorn
 except ImportError:
     print("❌ Missing dependencies. Please install FastAPI and uvicorn:")
     print("pip install fastapi uvicorn")
     sys.exit(1)
 
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as _DefaultResponseClass
+
+    def _json_dumps_bytes(obj):
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    from fastapi.responses import JSONResponse as _DefaultResponseClass
+
+    def _json_dumps_bytes(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+import httpx
+import pydantic
+
 from langchain_mcp_adapters.client import MultiServerMCPClient
 
 
 # Global client instance
 mcp_client = None
 available_tools = []
+tools_by_name = {}
+tool_meta = {}
+server_pool = None
 
+# Serializes lazy client creation; without it a caller arriving mid-discovery
+# would see a non-None mcp_client and execute against the stale catalog
+_client_lock = asyncio.Lock()
 
-async def initialize_mcp_client():
-    """Initialize the MCP client with test servers and AWS Terraform MCP server."""
-    global mcp_client, available_tools
-    
-    # Get absolute paths to test servers
+# Pre-serialized /api/tools payload, rebuilt whenever the catalog changes
+_tools_json = b"[]"
+_tools_etag = ""
+
+# Directory for the on-disk tool discovery cache
+TOOL_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "mcp_demo")
+
+# One precompiled scan instead of four any(keyword in name ...) loops per tool;
+# the matched group name tells us the category directly
+CATEGORY_RE = re.compile(
+    r"(?P<Math>add|subtract|multiply|divide)"
+    r"|(?P<Time>time|date)"
+    r"|(?P<Weather>weather|temperature)"
+    r"|(?P<TerraformAWS>terraform|aws|checkov|provider)"
+)
+CATEGORY_LABELS = {"TerraformAWS": "Terraform/AWS"}
+
+# Numeric-string patterns for the schema-less coercion fallback; handles
+# negatives and exponents that the old isdigit() checks silently missed
+_INT_RE = re.compile(r"-?\d+")
+_FLOAT_RE = re.compile(r"-?\d+\.\d+([eE]-?\d+)?")
+
+
+def _classify(lname):
+    """Map an already-lowercased tool name to its display category."""
+    match = CATEGORY_RE.search(lname)
+    return CATEGORY_LABELS.get(match.lastgroup, match.lastgroup) if match else 'Other'
+
+
+class MCPServerPool:
+    """Execution pool holding one asyncio.Lock per MCP server.
+
+    Calls against the same server are serialized (the stdio transport is a
+    single pipe), while calls against different servers run concurrently.
+    """
+
+    def __init__(self, server_names):
+        self.locks = {name: asyncio.Lock() for name in server_names}
+        self.tool_to_server = {}
+
+    def register_tools(self, server_name, tools):
+        """Record which server owns each tool, built during discovery."""
+        for tool in tools:
+            self.tool_to_server[tool.name] = server_name
+
+    async def invoke(self, tool, tool_call):
+        """Invoke a tool under its server's lock, restarting once on a dead pipe."""
+        server_name = self.tool_to_server.get(tool.name)
+        lock = self.locks.get(server_name)
+        if lock is None:
+            return await tool.ainvoke(tool_call)
+
+        async with lock:
+            try:
+                return await tool.ainvoke(tool_call)
+            except (BrokenPipeError, ConnectionError):
+                # The stdio subprocess died; the adapter opens a fresh session
+                # per call, so a single retry restarts just this server without
+                # affecting its siblings.
+                return await tool.ainvoke(tool_call)
+
+
+class CachedTool:
+    """Lightweight stand-in for a discovered tool, loaded from the disk cache.
+
+    Carries just the metadata the web UI needs (name/description/args_schema)
+    so the app can serve `/api/tools` without spawning any MCP subprocesses.
+    """
+
+    def __init__(self, name, description, args_schema):
+        self.name = name
+        self.description = description
+        self.args_schema = args_schema
+
+
+def get_server_configs():
+    """Build the server configs for the local test server and AWS Terraform MCP server."""
+    # One multiplexed process serves the math/time/weather tools: a single
+    # fork and one tools/list round-trip instead of three
     current_dir = os.path.dirname(os.path.abspath(__file__))
-    math_server_path = os.path.join(current_dir, "tests", "servers", "math_server.py")
-    time_server_path = os.path.join(current_dir, "tests", "servers", "time_server.py")
-    weather_server_path = os.path.join(current_dir, "tests", "servers", "weather_server.py")
-    
-    # Create MCP client with test servers and AWS Terraform MCP server
-    server_configs = {
-        "math": {
-            "command": sys.executable,
-            "args": [math_server_path],
-            "transport": "stdio",
-        },
-        "time": {
-            "command": sys.executable,
-            "args": [time_server_path],
-            "transport": "stdio",
-        },
-        "weather": {
+    combined_server_path = os.path.join(current_dir, "tests", "servers", "combined_server.py")
+
+    return {
+        "local": {
             "command": sys.executable,
-            "args": [weather_server_path],
+            "args": [combined_server_path],
             "transport": "stdio",
         },
         "terraform": {
@@ -60,33 +154,201 @@ async def initialize_mcp_client():
             }
         }
     }
-    
-    mcp_client = MultiServerMCPClient(server_configs)
-    
-    # Load available tools
+
+
+def _tool_cache_key(server_configs):
+    """Hash the server configs plus local server script mtimes into a cache key."""
+    hasher = hashlib.sha256(json.dumps(server_configs, sort_keys=True).encode())
+    for config in server_configs.values():
+        for arg in config.get("args", []):
+            if os.path.isfile(arg):
+                hasher.update(str(os.stat(arg).st_mtime_ns).encode())
+    return hasher.hexdigest()[:16]
+
+
+def _tool_cache_path(cache_key):
+    return os.path.join(TOOL_CACHE_DIR, f"tools-{cache_key}.json")
+
+
+def _load_cached_tools(cache_key):
+    """Load the cached tool catalog, or None on a cache miss."""
+    try:
+        with open(_tool_cache_path(cache_key)) as f:
+            return [CachedTool(**entry) for entry in json.load(f)]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _store_cached_tools(cache_key, tools):
+    """Atomically persist the tool catalog so other processes never see partial writes."""
+    tools_data = [
+        {
+            "name": tool.name,
+            "description": tool.description,
+            "args_schema": tool.args_schema if hasattr(tool, 'args_schema') else {},
+        }
+        for tool in tools
+    ]
     try:
-        available_tools = await mcp_client.get_tools()
+        os.makedirs(TOOL_CACHE_DIR, exist_ok=True)
+        cache_path = _tool_cache_path(cache_key)
+        # Serialize writers across uvicorn workers: whichever worker finishes
+        # discovery first populates the cache, the rest skip the write
+        with open(os.path.join(TOOL_CACHE_DIR, "tools.lock"), "w") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(tools_data, f)
+            os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"⚠️  Could not write tool cache: {e}")
+
+
+# JSON-schema scalar types to Python types for building Pydantic param models
+_JSON_TYPE_MAP = {
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "string": str,
+    "array": list,
+    "object": dict,
+}
+
+
+def _build_param_model(tool_name, args_schema):
+    """Build a Pydantic model for a tool's parameters from its JSON schema.
+
+    Returns None when the schema is missing or has no properties; callers
+    fall back to the untyped coercion path.
+    """
+    if not isinstance(args_schema, dict):
+        return None
+    properties = args_schema.get("properties")
+    if not properties:
+        return None
+    required = set(args_schema.get("required", []))
+    fields = {}
+    for key, prop in properties.items():
+        param_type = _JSON_TYPE_MAP.get(prop.get("type"), Any) if isinstance(prop, dict) else Any
+        fields[key] = (param_type, ... if key in required else None)
+    try:
+        return pydantic.create_model(f"{tool_name}Params", **fields)
+    except Exception:
+        return None
+
+
+class ToolMeta:
+    """Per-tool schema metadata precomputed once at discovery time.
+
+    Carries the compiled Pydantic validator plus the required/property name
+    sets so /api/execute never introspects args_schema at request time.
+    """
+
+    def __init__(self, tool):
+        schema = getattr(tool, 'args_schema', None)
+        if not isinstance(schema, dict):
+            schema = {}
+        self.tool = tool
+        self.validator = _build_param_model(tool.name, schema)
+        self.required = frozenset(schema.get("required", []))
+        self.properties = tuple(schema.get("properties", {}).keys())
+
+
+def _build_tool_meta():
+    """Cache the schema metadata and validators for the current catalog."""
+    global tool_meta
+    tool_meta = {tool.name: ToolMeta(tool) for tool in available_tools}
+
+
+def _rebuild_tools_payload():
+    """Serialize the tool catalog once; /api/tools just sends the buffer."""
+    global _tools_json, _tools_etag
+    _tools_json = _json_dumps_bytes([
+        {
+            "name": tool.name,
+            "description": tool.description,
+            "args_schema": tool.args_schema if hasattr(tool, 'args_schema') else {},
+        }
+        for tool in available_tools
+    ])
+    _tools_etag = hashlib.blake2b(_tools_json, digest_size=8).hexdigest()
+
+
+async def ensure_mcp_client():
+    """Lazily create the real MCP client and load the live tools.
+
+    The startup path serves cached metadata only; the subprocesses are spawned
+    here, on the first call that actually needs to execute a tool.
+    """
+    global mcp_client, available_tools, tools_by_name, server_pool
+
+    if mcp_client is not None:
+        return mcp_client
+
+    async with _client_lock:
+        # Someone else may have finished discovery while we waited
+        if mcp_client is not None:
+            return mcp_client
+
+        server_configs = get_server_configs()
+        client = MultiServerMCPClient(server_configs)
+        pool = MCPServerPool(server_configs)
+
+        # Discover per server so the pool knows which server owns each tool
+        tools_per_server = await asyncio.gather(
+            *(client.get_tools(server_name=name) for name in server_configs)
+        )
+        tools = []
+        for server_name, server_tools in zip(server_configs, tools_per_server):
+            pool.register_tools(server_name, server_tools)
+            tools.extend(server_tools)
+
+        # Publish only once discovery is complete, and mcp_client last: the
+        # unlocked fast path above keys off it, so nobody can observe the
+        # live client with a half-built catalog
+        available_tools = tools
+        tools_by_name = {tool.name: tool for tool in tools}
+        server_pool = pool
+        _build_tool_meta()
+
+        _store_cached_tools(_tool_cache_key(server_configs), tools)
+        _rebuild_tools_payload()
+        mcp_client = client
+
+    return mcp_client
+
+
+async def initialize_mcp_client():
+    """Initialize the MCP client with test servers and AWS Terraform MCP server."""
+    global mcp_client, available_tools, tools_by_name
+
+    server_configs = get_server_configs()
+
+    # Try the disk cache first so startup doesn't pay the subprocess spawn cost
+    cached_tools = _load_cached_tools(_tool_cache_key(server_configs))
+    if cached_tools is not None:
+        available_tools = cached_tools
+        tools_by_name = {tool.name: tool for tool in available_tools}
+        _build_tool_meta()
+        _rebuild_tools_payload()
+        print(f"✅ Loaded {len(available_tools)} MCP tools from cache")
+        return
+
+    # Cache miss: spawn the servers and persist the catalog for next startup
+    try:
+        await ensure_mcp_client()
         print(f"✅ Loaded {len(available_tools)} MCP tools")
         
         # Print tool categories for debugging
-        tool_categories = {}
+        tool_categories = defaultdict(list)
         for tool in available_tools:
-            # Try to categorize tools based on name patterns
-            if any(keyword in tool.name.lower() for keyword in ['add', 'subtract', 'multiply', 'divide']):
-                category = 'Math'
-            elif any(keyword in tool.name.lower() for keyword in ['time', 'date']):
-                category = 'Time'
-            elif any(keyword in tool.name.lower() for keyword in ['weather', 'temperature']):
-                category = 'Weather'
-            elif any(keyword in tool.name.lower() for keyword in ['terraform', 'aws', 'checkov', 'provider']):
-                category = 'Terraform/AWS'
-            else:
-                category = 'Other'
-            
-            if category not in tool_categories:
-                tool_categories[category] = []
-            tool_categories[category].append(tool.name)
-        
+            # One .lower() and one regex scan per tool
+            lname = tool.name.lower()
+            tool_categories[_classify(lname)].append(tool.name)
+
         print("📊 Tool categories:")
         for category, tools in tool_categories.items():
             print(f"  {category}: {len(tools)} tools - {', '.join(tools[:3])}{'...' if len(tools) > 3 else ''}")
@@ -96,28 +358,113 @@ async def initialize_mcp_client():
         available_tools = []
 
 
+@asynccontextmanager
+async def lifespan(app):
+    """Start MCP initialization in the background and clean up on shutdown.
+
+    The server binds its socket immediately; the frontend polls /api/ready
+    until the catalog is populated.
+    """
+    # Size the default executor up front; large terraform results are JSON
+    # encoded on these threads instead of the event loop
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2))
+
+    # One pooled HTTP client for all outbound requests, so repeat calls reuse
+    # keep-alive connections instead of paying a TCP+TLS handshake each time.
+    limits = httpx.Limits(max_keepalive_connections=64, max_connections=256)
+    try:
+        app.state.http = httpx.AsyncClient(http2=True, limits=limits, timeout=30)
+    except ImportError:
+        # http2 needs the optional h2 package; keep-alive pooling still applies
+        app.state.http = httpx.AsyncClient(limits=limits, timeout=30)
+
+    warmup_task = asyncio.create_task(_startup_warmup())
+
+    yield
+
+    # Cancel the warmup if it is still spawning subprocesses so shutdown
+    # doesn't hang on (or orphan) a half-started MCP server
+    warmup_task.cancel()
+    try:
+        await warmup_task
+    except asyncio.CancelledError:
+        pass
+    await app.state.http.aclose()
+
+
 # Create FastAPI app
-app = FastAPI(title="MCP Tools Web Demo with AWS Terraform", description="Test MCP tools including AWS Terraform through a web interface")
+app = FastAPI(
+    title="MCP Tools Web Demo with AWS Terraform",
+    description="Test MCP tools including AWS Terraform through a web interface",
+    default_response_class=_DefaultResponseClass,
+    lifespan=lifespan,
+)
+
+# Tool catalogs and terraform doc results are large, repetitive JSON —
+# compress anything over 1KB before it hits the socket
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Serve the precompiled stylesheet (and any vendored JS) locally instead of
+# hitting two CDNs per page load; the assets only change with the code, so
+# far-future caching is safe
+app.mount("/static", StaticFiles(directory=os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")), name="static")
+
+
+@app.middleware("http")
+async def _static_cache_headers(request, call_next):
+    response = await call_next(request)
+    if request.url.path.startswith("/static/"):
+        response.headers.setdefault("Cache-Control", "public,max-age=31536000,immutable")
+    return response
+
 
+async def _startup_warmup():
+    """Load the catalog, then warm the real client so the first execute is fast.
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize MCP client on startup."""
+    On a cache hit the catalog holds CachedTool stubs until the warmup
+    finishes; executes that land in that window wait on _client_lock inside
+    ensure_mcp_client and then run against the real tools.
+    """
     await initialize_mcp_client()
+    try:
+        await ensure_mcp_client()
+    except Exception as e:
+        print(f"⚠️  MCP client warmup failed: {e}")
 
 
-@app.get("/", response_class=HTMLResponse)
-async def main_page():
-    """Serve the main page with tool testing interface."""
-    html_content = """
+@app.get("/api/ready")
+async def ready():
+    """Report whether the tool catalog has been loaded yet."""
+    return {"ready": bool(available_tools)}
+
+
+# The SPA shell is static for the lifetime of the process: encode it once at
+# import and serve the same bytes (with an ETag) on every request
+_INDEX_HTML = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>MCP Tools Web Demo with AWS Terraform</title>
-        <script src="https://cdn.tailwindcss.com"></script>
-        <script src="https://unpkg.com/alpinejs@3.x.x/dist/cdn.min.js" defer></script>
+        <link rel="stylesheet" href="/static/tw.css">
+        <script>
+            // Prefer a vendored Alpine build (drop alpinejs cdn.min.js into
+            // static/alpine.min.js); fall back to the CDN if it isn't there
+            (function () {
+                var s = document.createElement('script');
+                s.src = '/static/alpine.min.js';
+                s.defer = true;
+                s.onerror = function () {
+                    var cdn = document.createElement('script');
+                    cdn.src = 'https://unpkg.com/alpinejs@3.x.x/dist/cdn.min.js';
+                    cdn.defer = true;
+                    document.head.appendChild(cdn);
+                };
+                document.head.appendChild(s);
+            })();
+        </script>
     </head>
     <body class="bg-gray-50 min-h-screen">
         <div class="container mx-auto px-4 py-8" x-data="mcpDemo()">
@@ -152,14 +499,14 @@ async def main_page():
                                  @click="selectTool(tool)"
                                  :class="selectedTool?.name === tool.name ? 'border-blue-500 bg-blue-50' : 'border-gray-200'">
                                 <h3 class="font-medium text-lg mb-2 flex items-center">
-                                    <span x-text="getToolIcon(tool.name)" class="mr-2"></span>
+                                    <span x-text="tool._icon" class="mr-2"></span>
                                     <span x-text="tool.name"></span>
                                 </h3>
                                 <p class="text-gray-600 text-sm" x-text="tool.description"></p>
                                 <div class="mt-2">
-                                    <span x-text="getToolCategory(tool.name)" 
+                                    <span x-text="tool._category"
                                           class="inline-block px-2 py-1 text-xs rounded-full"
-                                          :class="getCategoryClass(tool.name)"></span>
+                                          :class="getCategoryClass(tool._category)"></span>
                                 </div>
                             </div>
                         </template>
@@ -175,8 +522,8 @@ async def main_page():
                 <!-- Tool Testing Interface -->
                 <div x-show="selectedTool" class="bg-white rounded-lg shadow-md p-6">
                     <h2 class="text-2xl font-semibold mb-4 flex items-center">
-                        🧪 Test Tool: 
-                        <span x-text="getToolIcon(selectedTool?.name)" class="mx-2"></span>
+                        🧪 Test Tool:
+                        <span x-text="selectedTool?._icon" class="mx-2"></span>
                         <span x-text="selectedTool?.name"></span>
                     </h2>
                     
@@ -298,13 +645,24 @@ async def main_page():
 
                     get filteredTools() {
                         if (!this.toolFilter) return this.tools;
-                        return this.tools.filter(tool => 
-                            tool.name.toLowerCase().includes(this.toolFilter.toLowerCase()) ||
-                            tool.description.toLowerCase().includes(this.toolFilter.toLowerCase())
+                        const filter = this.toolFilter.toLowerCase();
+                        return this.tools.filter(tool =>
+                            tool._lname.includes(filter) || tool._ldesc.includes(filter)
                         );
                     },
 
                     async init() {
+                        // Wait for the server to finish loading the catalog in the background
+                        while (true) {
+                            try {
+                                const response = await fetch('/api/ready');
+                                const data = await response.json();
+                                if (data.ready) break;
+                            } catch (err) {
+                                console.error('Readiness check failed:', err);
+                            }
+                            await new Promise(resolve => setTimeout(resolve, 500));
+                        }
                         await this.loadTools();
                     },
 
@@ -312,14 +670,23 @@ async def main_page():
                         try {
                             const response = await fetch('/api/tools');
                             this.tools = await response.json();
+                            // Precompute per-tool display data once so renders and
+                            // filter keystrokes don't re-lowercase every name
+                            this.tools.forEach(tool => {
+                                tool._lname = tool.name.toLowerCase();
+                                tool._ldesc = (tool.description || '').toLowerCase();
+                                tool._icon = this.getToolIcon(tool._lname);
+                                tool._category = this.getToolCategory(tool._lname);
+                            });
                         } catch (err) {
                             console.error('Failed to load tools:', err);
                         }
                     },
 
-                    getToolIcon(toolName) {
-                        if (!toolName) return '🔧';
-                        const name = toolName.toLowerCase();
+                    // These take an already-lowercased name and run once per tool
+                    // in loadTools(); templates read the cached tool._icon/_category
+                    getToolIcon(name) {
+                        if (!name) return '🔧';
                         if (name.includes('add') || name.includes('subtract') || name.includes('multiply') || name.includes('divide')) return '🧮';
                         if (name.includes('time') || name.includes('date')) return '⏰';
                         if (name.includes('weather') || name.includes('temperature')) return '🌤️';
@@ -329,9 +696,8 @@ async def main_page():
                         return '🔧';
                     },
 
-                    getToolCategory(toolName) {
-                        if (!toolName) return 'Other';
-                        const name = toolName.toLowerCase();
+                    getToolCategory(name) {
+                        if (!name) return 'Other';
                         if (name.includes('add') || name.includes('subtract') || name.includes('multiply') || name.includes('divide')) return 'Math';
                         if (name.includes('time') || name.includes('date')) return 'Time';
                         if (name.includes('weather') || name.includes('temperature')) return 'Weather';
@@ -339,8 +705,7 @@ async def main_page():
                         return 'Other';
                     },
 
-                    getCategoryClass(toolName) {
-                        const category = this.getToolCategory(toolName);
+                    getCategoryClass(category) {
                         switch(category) {
                             case 'Math': return 'bg-blue-100 text-blue-800';
                             case 'Time': return 'bg-green-100 text-green-800';
@@ -423,61 +788,132 @@ async def main_page():
     </body>
     </html>
     """
-    return html_content
+_INDEX_HTML_BYTES = _INDEX_HTML.encode("utf-8")
+_INDEX_ETAG = hashlib.blake2b(_INDEX_HTML_BYTES, digest_size=8).hexdigest()
+
+
+@app.get("/")
+async def main_page(request: Request):
+    """Serve the main page with tool testing interface."""
+    if request.headers.get("if-none-match") == _INDEX_ETAG:
+        return Response(status_code=304)
+    return Response(
+        _INDEX_HTML_BYTES,
+        media_type="text/html; charset=utf-8",
+        headers={"ETag": _INDEX_ETAG, "Cache-Control": "public,max-age=3600"},
+    )
 
 
 @app.get("/api/tools")
-async def get_tools():
-    """Get available tools as JSON."""
-    tools_data = []
-    for tool in available_tools:
-        tools_data.append({
-            "name": tool.name,
-            "description": tool.description,
-            "args_schema": tool.args_schema if hasattr(tool, 'args_schema') else {}
-        })
-    return tools_data
+async def get_tools(request: Request):
+    """Get available tools as JSON, served from the pre-serialized buffer."""
+    if request.headers.get("if-none-match") == _tools_etag:
+        return Response(status_code=304)
+    return Response(
+        _tools_json,
+        media_type="application/json",
+        headers={"ETag": _tools_etag, "Cache-Control": "public,max-age=60"},
+    )
+
+
+async def _invoke_tool(tool_name, parameters):
+    """Validate parameters and run one tool call, returning its content."""
+    # Execution needs live sessions, so swap cached metadata for the real client
+    await ensure_mcp_client()
+
+    # Find the tool with an O(1) lookup instead of scanning the catalog
+    tool = tools_by_name.get(tool_name)
+    if tool is None:
+        raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
+
+    # Clean up parameters (remove empty strings, convert numeric strings)
+    filled_params = {k: v for k, v in parameters.items() if v != ""}
+    meta = tool_meta.get(tool_name)
+    if meta is not None and meta.validator is not None:
+        # Coerce via the cached Pydantic model built from the tool's
+        # args_schema — typed, and the parse runs in pydantic-core
+        missing = meta.required - filled_params.keys()
+        if missing:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Missing required parameters: {', '.join(sorted(missing))}",
+            )
+        clean_params = meta.validator.model_validate(filled_params).model_dump(
+            exclude_unset=True
+        )
+    else:
+        # No schema for this tool: fall back to guessing numeric strings,
+        # one regex pass per value instead of two isdigit() scans
+        clean_params = {}
+        for k, v in filled_params.items():
+            if _INT_RE.fullmatch(v):
+                clean_params[k] = int(v)
+            elif _FLOAT_RE.fullmatch(v):
+                clean_params[k] = float(v)
+            else:
+                clean_params[k] = v
+
+    # Execute the tool under its server's lock so calls to different
+    # servers run in parallel while same-server calls stay serialized
+    result = await server_pool.invoke(tool, {
+        "args": clean_params,
+        "id": f"web_ui_{tool_name}",
+        "type": "tool_call"
+    })
+    return result.content
+
+
+async def _encode_response(payload):
+    """Encode a response payload off the event loop.
+
+    Terraform doc results can be kilobytes of markdown and would
+    head-of-line-block other requests if encoded on the loop thread.
+    """
+    loop = asyncio.get_running_loop()
+    body = await loop.run_in_executor(None, _json_dumps_bytes, payload)
+    return Response(body, media_type="application/json")
 
 
 @app.post("/api/execute")
 async def execute_tool(request: Request):
     """Execute a tool with given parameters."""
     try:
-        data = await request.json()
-        tool_name = data.get("tool_name")
-        parameters = data.get("parameters", {})
-        
-        # Find the tool
-        tool = None
-        for t in available_tools:
-            if t.name == tool_name:
-                tool = t
-                break
-        
-        if not tool:
-            raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
-        
-        # Clean up parameters (remove empty strings, convert numeric strings)
-        clean_params = {}
-        for k, v in parameters.items():
-            if v != "":
-                # Try to convert to appropriate type
-                if v.isdigit():
-                    clean_params[k] = int(v)
-                elif v.replace('.', '').isdigit():
-                    clean_params[k] = float(v)
-                else:
-                    clean_params[k] = v
-        
-        # Execute the tool
-        result = await tool.ainvoke({
-            "args": clean_params,
-            "id": f"web_ui_{tool_name}",
-            "type": "tool_call"
+        # Parse the body with orjson when available, skipping starlette's
+        # stdlib json path
+        data = _json_loads(await request.body())
+        content = await _invoke_tool(data.get("tool_name"), data.get("parameters", {}))
+        return await _encode_response({"result": content})
+
+    except HTTPException:
+        # Let the 404/422 from _invoke_tool through instead of wrapping
+        # them into a 500
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/execute_batch")
+async def execute_batch(request: Request):
+    """Execute several independent tool calls in one request.
+
+    Calls are dispatched concurrently; the per-server locks still serialize
+    same-server calls, so the batch completes in the time of its slowest
+    server rather than the sum of all calls.
+    """
+    try:
+        data = _json_loads(await request.body())
+        calls = data.get("calls", [])
+        results = await asyncio.gather(
+            *(_invoke_tool(call.get("tool_name"), call.get("parameters", {})) for call in calls),
+            return_exceptions=True,
+        )
+        return await _encode_response({
+            "results": [
+                {"error": str(r)} if isinstance(r, Exception) else {"result": r}
+                for r in results
+            ]
         })
-        
-        return {"result": result.content}
-        
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -490,8 +926,31 @@ def main():
     print()
     print("🌐 Web interface will be available at: http://localhost:8000")
     print("🛑 Press Ctrl+C to stop the server")
-    
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
+
+    # Prefer uvloop + httptools when installed (pip install uvloop httptools):
+    # the demo is pure I/O proxying, so the faster event loop and HTTP parser
+    # are a drop-in throughput win. Fall back to uvicorn's defaults otherwise.
+    try:
+        import uvloop  # noqa: F401
+        import httptools  # noqa: F401
+        loop, http = "uvloop", "httptools"
+    except ImportError:
+        loop, http = "auto", "auto"
+
+    # One worker per core; the MCP client is lazy and the tool cache on disk
+    # is shared, so only the first worker pays the discovery cost. Note that
+    # each worker still gets its own stdio MCP subprocesses on first execute.
+    workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+
+    uvicorn.run(
+        "demo_mcp_tools:app",
+        host="0.0.0.0",
+        port=8000,
+        loop=loop,
+        http=http,
+        workers=workers,
+        log_level="info",
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Shared MCP client and tool list for the test scripts.
+
+Each script used to construct its own MultiServerMCPClient, which
+cold-starts the uvx terraform server (a heavy subprocess importing boto3,
+pydantic, ...) on every run. Importing get_client()/get_tools() from here
+means repeat calls in the same process — e.g. several scripts in one
+pytest run — pay that cold start once and share the discovered tool list.
+"""
+
+import asyncio
+import os
+import sys
+
+from langchain_mcp_adapters.client import MultiServerMCPClient
+
+_client = None
+_tools = None
+_lock = asyncio.Lock()
+
+
+def default_server_configs():
+    """Server configs shared by the test scripts: local tools plus terraform."""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    combined_server_path = os.path.join(current_dir, "tests", "servers", "combined_server.py")
+
+    # terraform runs inside the uvx server subprocess, which gets a minimal
+    # environment — the plugin cache only takes effect if we pass it in the
+    # server env, so init links providers instead of re-downloading them
+    plugin_cache_dir = os.path.expanduser("~/.terraform.d/plugin-cache")
+    os.makedirs(plugin_cache_dir, exist_ok=True)
+
+    return {
+        "local": {
+            "command": sys.executable,
+            "args": [combined_server_path],
+            "transport": "stdio",
+        },
+        "terraform": {
+            "command": "uvx",
+            "args": ["awslabs.terraform-mcp-server@latest"],
+            "transport": "stdio",
+            "env": {
+                "FASTMCP_LOG_LEVEL": "ERROR",
+                "AWS_PROFILE": os.environ.get('AWS_PROFILE', 'default'),
+                "AWS_DEFAULT_REGION": os.environ.get('AWS_DEFAULT_REGION', 'us-east-1'),
+                "TF_PLUGIN_CACHE_DIR": plugin_cache_dir,
+            }
+        }
+    }
+
+
+async def get_client():
+    """Return the shared MultiServerMCPClient, creating it on first use."""
+    global _client
+    async with _lock:
+        if _client is None:
+            _client = MultiServerMCPClient(default_server_configs())
+    return _client
+
+
+async def get_tools():
+    """Return the shared tool list, discovering it on first use."""
+    global _tools
+    client = await get_client()
+    async with _lock:
+        if _tools is None:
+            _tools = await client.get_tools()
+    return _tools
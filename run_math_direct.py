@@ -22,15 +22,15 @@ async def main():
             tools = await load_mcp_tools(session)
             print(f"Loaded tools: {[tool.name for tool in tools]}")
             
-            # Directly call the tools without using an agent
-            print("\nTesting the 'add' tool...")
-            add_tool = next(tool for tool in tools if tool.name == "add")
-            add_result = await add_tool.ainvoke({"a": 3, "b": 5})
+            # Directly call the tools without using an agent; the two calls
+            # are independent so run them concurrently
+            print("\nTesting the 'add' and 'multiply' tools concurrently...")
+            tools_by_name = {tool.name: tool for tool in tools}
+            add_result, multiply_result = await asyncio.gather(
+                tools_by_name["add"].ainvoke({"a": 3, "b": 5}),
+                tools_by_name["multiply"].ainvoke({"a": 7, "b": 8}),
+            )
             print(f"3 + 5 = {add_result}")
-            
-            print("\nTesting the 'multiply' tool...")
-            multiply_tool = next(tool for tool in tools if tool.name == "multiply")
-            multiply_result = await multiply_tool.ainvoke({"a": 7, "b": 8})
             print(f"7 * 8 = {multiply_result}")
 
 if __name__ == "__main__":
@@ -37,29 +37,22 @@ async def main():
     model = ChatOpenAI(model="gpt-3.5-turbo")
     agent = create_react_agent(model, tools)
     
-    # Test with math query
-    print("\nRunning math query...")
-    math_query = "What is 7 multiplied by 9?"
-    math_response = await agent.ainvoke({"messages": [{"role": "user", "content": math_query}]})
-    print("Math Response:")
-    for message in math_response["messages"]:
-        print(f"{message['role'].upper()}: {message['content']}")
-    
-    # Test with weather query
-    print("\nRunning weather query...")
-    weather_query = "What's the weather in New York?"
-    weather_response = await agent.ainvoke({"messages": [{"role": "user", "content": weather_query}]})
-    print("Weather Response:")
-    for message in weather_response["messages"]:
-        print(f"{message['role'].upper()}: {message['content']}")
-    
-    # Test with time query
-    print("\nRunning time query...")
-    time_query = "What time is it now?"
-    time_response = await agent.ainvoke({"messages": [{"role": "user", "content": time_query}]})
-    print("Time Response:")
-    for message in time_response["messages"]:
-        print(f"{message['role'].upper()}: {message['content']}")
+    # The three queries are independent, so dispatch them concurrently and
+    # print the responses in the original order once they all finish
+    queries = [
+        ("Math", "What is 7 multiplied by 9?"),
+        ("Weather", "What's the weather in New York?"),
+        ("Time", "What time is it now?"),
+    ]
+    print("\nRunning math, weather and time queries concurrently...")
+    responses = await asyncio.gather(
+        *(agent.ainvoke({"messages": [{"role": "user", "content": query}]}) for _, query in queries)
+    )
+
+    for (label, _), response in zip(queries, responses):
+        print(f"\n{label} Response:")
+        for message in response["messages"]:
+            print(f"{message['role'].upper()}: {message['content']}")
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
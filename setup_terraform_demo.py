@@ -1,75 +1,138 @@
 #!/usr/bin/env python3
 """Setup script for AWS Terraform MCP integration demo."""
 
+import asyncio
+import hashlib
+import importlib.metadata
+import json
+import shlex
+import shutil
 import subprocess
 import sys
 import os
+import time
 from pathlib import Path
 
+# Marker file memoizing a successful Terraform MCP server probe; a fresh
+# marker lets repeat setups skip the uvx resolve/download entirely
+PROBE_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "mcp_server", "terraform_probe.json"
+)
+PROBE_TTL_SECONDS = 24 * 60 * 60
+
 def run_command(command, description):
-    """Run a command and handle errors."""
+    """Run a command, streaming its output as it happens."""
     print(f"🔄 {description}...")
+    # shlex.split + shell=False skips the intermediate /bin/sh fork, and
+    # streaming stdout line by line means long steps (pip, uvx downloads)
+    # show progress live instead of going silent until they finish
+    argv = shlex.split(command) if isinstance(command, str) else command
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print(f"✅ {description} completed successfully")
-        if result.stdout:
-            print(f"   Output: {result.stdout.strip()}")
-        return True
-    except subprocess.CalledProcessError as e:
+        proc = subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+    except OSError as e:
         print(f"❌ {description} failed: {e}")
-        if e.stdout:
-            print(f"   Stdout: {e.stdout}")
-        if e.stderr:
-            print(f"   Stderr: {e.stderr}")
         return False
 
+    for line in proc.stdout:
+        print(f"   {line.rstrip()}")
+    returncode = proc.wait()
+
+    if returncode == 0:
+        print(f"✅ {description} completed successfully")
+        return True
+    print(f"❌ {description} failed with exit code {returncode}")
+    return False
+
 def check_prerequisites():
     """Check if required tools are installed."""
     print("🔍 Checking prerequisites...")
-    
-    # Check for Python
-    try:
-        python_version = subprocess.run([sys.executable, "--version"], capture_output=True, text=True, check=True)
-        print(f"✅ Python: {python_version.stdout.strip()}")
-    except:
-        print("❌ Python not found")
-        return False
-    
-    # Check for uvx
-    try:
-        uvx_result = subprocess.run(["uvx", "--version"], capture_output=True, text=True, check=True)
-        print(f"✅ uvx: {uvx_result.stdout.strip()}")
-    except:
+
+    # We're already running inside the interpreter we'd be probing, so just
+    # read sys.version instead of forking a python --version subprocess
+    print(f"✅ Python: Python {sys.version.split()[0]}")
+
+    # A PATH lookup is enough to know uvx exists; no need to execute it
+    uvx_path = shutil.which("uvx")
+    if uvx_path:
+        print(f"✅ uvx: {uvx_path}")
+    else:
         print("❌ uvx not found. Installing...")
-        if not run_command("pip install uv", "Installing uv"):
+        if not run_command(f"{sys.executable} -m pip install uv", "Installing uv"):
             return False
-    
+
     return True
 
+def _missing_dependencies(dependencies):
+    """Return the packages that are not already installed in this environment."""
+    missing = []
+    for dep in dependencies:
+        dist_name = dep.split("==")[0].split("[")[0]
+        try:
+            importlib.metadata.distribution(dist_name)
+        except importlib.metadata.PackageNotFoundError:
+            missing.append(dep)
+    return missing
+
 def install_dependencies():
     """Install required Python dependencies."""
     print("\n📦 Installing Python dependencies...")
-    
+
     dependencies = [
         "fastapi",
         "uvicorn",
         "langchain-core",
         "mcp"
     ]
-    
-    for dep in dependencies:
-        if not run_command(f"pip install {dep}", f"Installing {dep}"):
-            return False
-    
-    return True
+
+    # Only hit pip (and the network) for packages that are actually missing;
+    # on warm runs this returns without spawning a subprocess at all
+    dependencies = _missing_dependencies(dependencies)
+    if not dependencies:
+        print("✅ All dependencies already installed")
+        return True
+
+    # One pip invocation for everything: the resolver and index walk run once
+    # and pip fetches the wheels concurrently, instead of paying a full pip
+    # cold start per package. sys.executable -m pip also guarantees we install
+    # into the interpreter running this script.
+    install_command = f"{sys.executable} -m pip install " + " ".join(
+        shlex.quote(dep) for dep in dependencies
+    )
+    return run_command(install_command, f"Installing {', '.join(dependencies)}")
 
 def test_terraform_server():
     """Test if the Terraform MCP server can be accessed."""
     print("\n🧪 Testing AWS Terraform MCP server...")
-    
+
+    # Trust a recent successful probe instead of re-resolving @latest on PyPI
+    try:
+        with open(PROBE_CACHE_PATH) as f:
+            probe = json.load(f)
+        probe_age = time.time() - os.path.getmtime(PROBE_CACHE_PATH)
+        if probe.get("status") == "success" and probe_age < PROBE_TTL_SECONDS:
+            print("✅ AWS Terraform MCP server is ready (cached probe)")
+            return True
+    except (OSError, ValueError):
+        pass
+
     # This will download the server if not available
     test_command = "uvx awslabs.terraform-mcp-server@latest --help"
-    if run_command(test_command, "Testing Terraform MCP server"):
+    success = run_command(test_command, "Testing Terraform MCP server")
+
+    try:
+        os.makedirs(os.path.dirname(PROBE_CACHE_PATH), exist_ok=True)
+        with open(PROBE_CACHE_PATH, "w") as f:
+            json.dump({"status": "success" if success else "failure"}, f)
+    except OSError:
+        pass
+
+    if success:
         print("✅ AWS Terraform MCP server is ready")
         return True
     else:
@@ -123,8 +186,18 @@ def create_example_config():
 """
     
     try:
-        with open("terraform_mcp_config_example.txt", "w") as f:
-            f.write(config_content)
+        new_content = config_content.encode()
+        config_path = Path("terraform_mcp_config_example.txt")
+        # Skip the write when the bytes are identical — repeat setups do zero
+        # I/O and the mtime doesn't get bumped for no reason
+        if (
+            config_path.exists()
+            and hashlib.sha256(config_path.read_bytes()).digest()
+            == hashlib.sha256(new_content).digest()
+        ):
+            print("✅ terraform_mcp_config_example.txt already up to date")
+            return True
+        config_path.write_bytes(new_content)
         print("✅ Created terraform_mcp_config_example.txt")
         return True
     except Exception as e:
@@ -174,13 +247,22 @@ def main():
     if not install_dependencies():
         print("\n❌ Dependency installation failed.")
         sys.exit(1)
-    
-    if not test_terraform_server():
+
+    # The server test (network-bound uvx resolve/download) and the config
+    # write (local disk) are independent, so overlap them in threads: the
+    # file lands while uvx is still downloading
+    async def _independent_steps():
+        return await asyncio.gather(
+            asyncio.to_thread(test_terraform_server),
+            asyncio.to_thread(create_example_config),
+        )
+
+    server_ok, config_ok = asyncio.run(_independent_steps())
+    if not server_ok:
         print("\n⚠️  Terraform server test failed, but continuing...")
-    
-    if not create_example_config():
+    if not config_ok:
         print("\n⚠️  Config file creation failed, but continuing...")
-    
+
     print_next_steps()
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 """Test script for AWS Terraform MCP integration."""
 
 import asyncio
+import re
 import sys
 import os
 from pathlib import Path
@@ -9,53 +10,32 @@ from pathlib import Path
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from langchain_mcp_adapters.client import MultiServerMCPClient
+from mcp_fixtures import get_tools
+
+# Keyword -> category lookup built once; a single compiled alternation scans
+# each tool name in one pass instead of four nested any()/in loops per tool
+KEYWORD_CAT = {
+    'add': 'Math', 'subtract': 'Math', 'multiply': 'Math', 'divide': 'Math',
+    'time': 'Time', 'date': 'Time',
+    'weather': 'Weather', 'temperature': 'Weather',
+    'terraform': 'Terraform/AWS', 'aws': 'Terraform/AWS',
+    'checkov': 'Terraform/AWS', 'provider': 'Terraform/AWS',
+}
+KEYWORD_RE = re.compile("|".join(map(re.escape, KEYWORD_CAT)))
 
 async def test_integration():
     """Test the AWS Terraform MCP integration."""
     print("🧪 Testing AWS Terraform MCP Integration")
     print("=" * 50)
-    
-    # Get paths to test servers
-    current_dir = Path(__file__).parent
-    math_server_path = current_dir / "tests" / "servers" / "math_server.py"
-    time_server_path = current_dir / "tests" / "servers" / "time_server.py"
-    weather_server_path = current_dir / "tests" / "servers" / "weather_server.py"
-    
-    # Server configurations
-    server_configs = {
-        "math": {
-            "command": sys.executable,
-            "args": [str(math_server_path)],
-            "transport": "stdio",
-        },
-        "time": {
-            "command": sys.executable,
-            "args": [str(time_server_path)],
-            "transport": "stdio",
-        },
-        "weather": {
-            "command": sys.executable,
-            "args": [str(weather_server_path)],
-            "transport": "stdio",
-        },
-        "terraform": {
-            "command": "uvx",
-            "args": ["awslabs.terraform-mcp-server@latest"],
-            "transport": "stdio",
-            "env": {
-                "FASTMCP_LOG_LEVEL": "ERROR"
-            }
-        }
-    }
-    
+
     try:
-        print("🔄 Initializing MCP client...")
-        client = MultiServerMCPClient(server_configs)
-        
+        # The shared fixture reuses one client and one discovery pass across
+        # every script that runs in this process
         print("🔄 Loading tools from all servers...")
-        tools = await client.get_tools()
-        
+        tools = await get_tools()
+        # One pass builds the lookup table; every later resolution is O(1)
+        tools_by_name = {tool.name: tool for tool in tools}
+
         print(f"✅ Successfully loaded {len(tools)} tools!")
         
         # Categorize tools
@@ -68,17 +48,8 @@ async def test_integration():
         }
         
         for tool in tools:
-            name = tool.name.lower()
-            if any(keyword in name for keyword in ['add', 'subtract', 'multiply', 'divide']):
-                categories['Math'].append(tool.name)
-            elif any(keyword in name for keyword in ['time', 'date']):
-                categories['Time'].append(tool.name)
-            elif any(keyword in name for keyword in ['weather', 'temperature']):
-                categories['Weather'].append(tool.name)
-            elif any(keyword in name for keyword in ['terraform', 'aws', 'checkov', 'provider']):
-                categories['Terraform/AWS'].append(tool.name)
-            else:
-                categories['Other'].append(tool.name)
+            m = KEYWORD_RE.search(tool.name.lower())
+            categories[KEYWORD_CAT[m.group(0)] if m else 'Other'].append(tool.name)
         
         print("\n📊 Tool Categories:")
         for category, tool_names in categories.items():
@@ -87,38 +58,45 @@ async def test_integration():
                 for tool_name in tool_names:
                     print(f"    - {tool_name}")
         
-        # Test a simple math operation
-        print("\n🧮 Testing Math Tool...")
-        try:
-            add_tool = next(tool for tool in tools if tool.name == 'add')
-            result = await add_tool.ainvoke({
+        # The math and AWS docs tests are independent round-trips over the
+        # stdio MCP transport, so fire them concurrently: total time is the
+        # slowest call instead of the sum
+        add_tool = tools_by_name['add']
+        aws_tools = [tool for tool in tools if 'aws' in tool.name.lower() and 'provider' in tool.name.lower()]
+
+        calls = [
+            add_tool.ainvoke({
                 "args": {"a": 5, "b": 3},
                 "id": "test_add",
                 "type": "tool_call"
             })
-            print(f"✅ Math test (5 + 3): {result.content}")
-        except Exception as e:
-            print(f"❌ Math test failed: {e}")
-        
-        # Test AWS provider docs search (if available)
-        aws_tools = [tool for tool in tools if 'aws' in tool.name.lower() and 'provider' in tool.name.lower()]
+        ]
+        if aws_tools:
+            calls.append(aws_tools[0].ainvoke({
+                "args": {"asset_name": "aws_s3_bucket"},
+                "id": "test_aws_docs",
+                "type": "tool_call"
+            }))
+
+        print("\n🧮 Testing tools concurrently...")
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        math_result = results[0]
+        if isinstance(math_result, Exception):
+            print(f"❌ Math test failed: {math_result}")
+        else:
+            print(f"✅ Math test (5 + 3): {math_result.content}")
+
         if aws_tools:
             print("\n🏗️ Testing AWS Terraform Tool...")
-            try:
-                aws_tool = aws_tools[0]
-                print(f"Found AWS tool: {aws_tool.name}")
-                print(f"Description: {aws_tool.description}")
-                
-                # Test with a simple S3 bucket search
-                result = await aws_tool.ainvoke({
-                    "args": {"asset_name": "aws_s3_bucket"},
-                    "id": "test_aws_docs",
-                    "type": "tool_call"
-                })
+            print(f"Found AWS tool: {aws_tools[0].name}")
+            print(f"Description: {aws_tools[0].description}")
+            aws_result = results[1]
+            if isinstance(aws_result, Exception):
+                print(f"❌ AWS tool test failed: {aws_result}")
+            else:
                 print("✅ AWS docs search successful!")
-                print(f"Result preview: {str(result.content)[:200]}...")
-            except Exception as e:
-                print(f"❌ AWS tool test failed: {e}")
+                print(f"Result preview: {str(aws_result.content)[:200]}...")
         else:
             print("\n⚠️  No AWS provider tools found")
         
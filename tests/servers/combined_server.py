@@ -0,0 +1,38 @@
+"""Single FastMCP server exposing the math, time and weather tools.
+
+Running one multiplexed process instead of three separate interpreters cuts
+startup forks, RSS and discovery round-trips; tool names are unchanged so
+the category classifier in the demo keeps working.
+"""
+
+from mcp.server.fastmcp import FastMCP
+
+mcp = FastMCP("Local")
+
+
+@mcp.tool()
+def add(a: int, b: int) -> int:
+    """Add two numbers"""
+    return a + b
+
+
+@mcp.tool()
+def multiply(a: int, b: int) -> int:
+    """Multiply two numbers"""
+    return a * b
+
+
+@mcp.tool()
+def get_time() -> str:
+    """Get current time"""
+    return "5:20:00 PM EST"
+
+
+@mcp.tool()
+async def get_weather(location: str) -> str:
+    """Get weather for location."""
+    return f"It's always sunny in {location}"
+
+
+if __name__ == "__main__":
+    mcp.run(transport="stdio")